@@ -1,34 +1,16 @@
-import logging
 import traceback
 
-from octoeverywhere.mdns import MDns
+# Note that we only import what __init__ and the smaller handlers need at the module level.
+# Everything that's only needed once RunBlocking is going drags in a large dependency graph, so
+# those imports are done inside RunBlocking. On slow disk targets this keeps the import phase of startup short.
 from octoeverywhere.sentry import Sentry
-from octoeverywhere.deviceid import DeviceId
-from octoeverywhere.telemetry import Telemetry
 from octoeverywhere.hostcommon import HostCommon
-from octoeverywhere.compression import Compression
-from octoeverywhere.printinfo import PrintInfoManager
-from octoeverywhere.httpsessions import HttpSessions
-from octoeverywhere.Webcam.webcamhelper import WebcamHelper
-from octoeverywhere.octopingpong import OctoPingPong
-from octoeverywhere.commandhandler import CommandHandler
-from octoeverywhere.octoeverywhereimpl import OctoEverywhere
 from octoeverywhere.notificationshandler import NotificationsHandler
-from octoeverywhere.octohttprequest import OctoHttpRequest
-from octoeverywhere.Proto.ServerHost import ServerHost
 from octoeverywhere.compat import Compat
 
 from linux_host.config import Config
-from linux_host.secrets import Secrets
-from linux_host.version import Version
 from linux_host.logger import LoggerInit
 
-from .bambucloud import BambuCloud
-from .bambuclient import BambuClient
-from .bambuwebcamhelper import BambuWebcamHelper
-from .bambucommandhandler import BambuCommandHandler
-from .bambustatetranslater import BambuStateTranslator
-
 # This file is the main host for the bambu service.
 class BambuHost:
 
@@ -64,9 +46,36 @@ class BambuHost:
     def RunBlocking(self, configPath, localStorageDir, repoRoot, devConfig_CanBeNone):
         # Do all of this in a try catch, so we can log any issues before exiting
         try:
-            self.Logger.info("################################################")
-            self.Logger.info("#### OctoEverywhere Bambu Connect Starting #####")
-            self.Logger.info("################################################")
+            # These are only needed to get the main runner going, so import them now instead of at module
+            # load, which keeps the process import phase as small as possible.
+            # pylint: disable=import-outside-toplevel
+            from octoeverywhere.mdns import MDns
+            from octoeverywhere.deviceid import DeviceId
+            from octoeverywhere.telemetry import Telemetry
+            from octoeverywhere.compression import Compression
+            from octoeverywhere.printinfo import PrintInfoManager
+            from octoeverywhere.httpsessions import HttpSessions
+            from octoeverywhere.Webcam.webcamhelper import WebcamHelper
+            from octoeverywhere.octopingpong import OctoPingPong
+            from octoeverywhere.commandhandler import CommandHandler
+            from octoeverywhere.octoeverywhereimpl import OctoEverywhere
+            from octoeverywhere.octohttprequest import OctoHttpRequest
+            from octoeverywhere.Proto.ServerHost import ServerHost
+
+            from linux_host.secrets import Secrets
+            from linux_host.version import Version
+
+            from .bambucloud import BambuCloud
+            from .bambuclient import BambuClient
+            from .bambuwebcamhelper import BambuWebcamHelper
+            from .bambucommandhandler import BambuCommandHandler
+            from .bambustatetranslater import BambuStateTranslator
+
+            # Log the banner as one record, so it only costs a single handler invocation.
+            self.Logger.info("\n".join([
+                "################################################",
+                "#### OctoEverywhere Bambu Connect Starting #####",
+                "################################################"]))
 
             # Find the version of the plugin, this is required and it will throw if it fails.
             pluginVersionStr = Version.GetPluginVersion(repoRoot)
@@ -83,11 +92,8 @@ class BambuHost:
             self.Secrets = Secrets(self.Logger, localStorageDir)
 
             # Now, detect if this is a new instance and we need to init our global vars. If so, the setup script will be waiting on this.
-            self.DoFirstTimeSetupIfNeeded()
-
-            # Get our required vars
-            printerId = self.GetPrinterId()
-            privateKey = self.GetPrivateKey()
+            # This returns the printer id and private key it just validated or created, so we don't hit the secret store again.
+            (printerId, privateKey) = self.DoFirstTimeSetupIfNeeded()
 
             # Set the printer ID into sentry.
             Sentry.SetPrinterId(printerId)
@@ -157,17 +163,20 @@ class BambuHost:
         except Exception as e:
             Sentry.Exception("!! Exception thrown out of main host run function.", e)
 
-        # Allow the loggers to flush before we exit
+        # Log the exit banner. Note there's no need to call logging.shutdown() here, the logging module
+        # registers it as an atexit handler and the buffered memory handler flushes on close, so the
+        # final lines still make it to disk.
         try:
-            self.Logger.info("##################################")
-            self.Logger.info("#### OctoEverywhere Exiting ######")
-            self.Logger.info("##################################")
-            logging.shutdown()
+            self.Logger.info("\n".join([
+                "##################################",
+                "#### OctoEverywhere Exiting ######",
+                "##################################"]))
         except Exception as e:
-            print("Exception in logging.shutdown "+str(e))
+            print("Exception when writing the exit log message "+str(e))
 
 
     # Ensures all required values are setup and valid before starting.
+    # Returns the validated (printerId, privateKey) tuple, so callers don't have to read them from the secret store again.
     def DoFirstTimeSetupIfNeeded(self):
         # Try to get the printer id from the config.
         printerId = self.GetPrinterId()
@@ -198,6 +207,8 @@ class BambuHost:
             self.Secrets.SetPrivateKey(privateKey)
             self.Logger.info("New private key created.")
 
+        return (printerId, privateKey)
+
 
     # Returns None if no printer id has been set.
     def GetPrinterId(self):
@@ -211,13 +222,14 @@ class BambuHost:
 
     # Tries to load a dev config option as a string.
     # If not found or it fails, this return None
-    def GetDevConfigStr(self, devConfig, value):
+    @staticmethod
+    def GetDevConfigStr(devConfig, value):
         if devConfig is None:
             return None
-        if value in devConfig:
-            v = devConfig[value]
-            if v is not None and len(v) > 0 and v != "None":
-                return v
+        # Use a single get, so we only do one dict lookup.
+        v = devConfig.get(value)
+        if v is not None and len(v) > 0 and v != "None":
+            return v
         return None
 
 
@@ -257,17 +269,18 @@ class BambuHost:
         # Check if this printer is unlinked, if so add a message to the log to help the user setup the printer if desired.
         # This would be if the skipped the printer link or missed it in the setup script.
         if connectedAccounts is None or len(connectedAccounts) == 0:
-            self.Logger.warning("")
-            self.Logger.warning("")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("          This Plugin Isn't Connected To OctoEverywhere!          ")
-            self.Logger.warning(" Use the following link to finish the setup and get remote access:")
-            self.Logger.warning(" %s", HostCommon.GetAddPrinterUrl(self.GetPrinterId(), False))
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("")
-            self.Logger.warning("")
+            self.Logger.warning("\n".join([
+                "",
+                "",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "          This Plugin Isn't Connected To OctoEverywhere!          ",
+                " Use the following link to finish the setup and get remote access:",
+                " " + HostCommon.GetAddPrinterUrl(self.GetPrinterId(), False),
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "",
+                ""]))
 
 
     #
@@ -1,12 +1,73 @@
 import os
 import sys
+import time
 import logging
 import logging.handlers
+import threading
 
 from .config import Config
 
+
+# A rotating file handler that opens the log file once with a large write buffer and doesn't flush
+# it per record. The base class defeats its own stream buffer twice per record - StreamHandler.emit
+# calls flush() after every write, and shouldRollover seeks the stream to find the file size, which
+# also flushes the buffer. Both are overridden here, so buffered records only hit the disk when the
+# 64 KB stream buffer fills, when FlushToDisk is called by the periodic flush thread, or when the
+# handler closes, since the underlying stream flushes on close.
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+
+    # The size of the write buffer used for the log file stream.
+    c_FileBufferSizeBytes = 64 * 1024
+
+    def _open(self):
+        # Track a running file size estimate, so shouldRollover doesn't have to seek the stream per record.
+        # Note this is called from the base __init__ and again by doRollover after the file is rotated away.
+        self.EstimatedFileSizeBytes = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        return open(self.baseFilename, self.mode, buffering=BufferedRotatingFileHandler.c_FileBufferSizeBytes, encoding=self.encoding)
+
+
+    # Called per record by the base emit. The base impl seeks the stream to get the current file size,
+    # which flushes the write buffer before every write. Use our running size estimate instead, so the
+    # buffer is left alone. The estimate can be off by a record or two around a rollover, which doesn't
+    # matter at the multi-megabyte sizes the log files are configured to.
+    def shouldRollover(self, record:logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            self.EstimatedFileSizeBytes += len(self.format(record)) + 1
+            if self.EstimatedFileSizeBytes >= self.maxBytes:
+                return True
+        return False
+
+
+    # Called by StreamHandler.emit after every record. Don't flush per record, that's the entire
+    # point of the write buffer.
+    def flush(self):
+        pass
+
+
+    # Does a real flush of the stream buffer to disk. Called by the periodic flush thread.
+    def FlushToDisk(self):
+        super().flush()
+
+
+    # ERROR and higher records must still hit the disk right away to preserve crash visibility,
+    # so force a real flush for them after the emit.
+    def emit(self, record:logging.LogRecord):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.FlushToDisk()
+
+
 class LoggerInit:
 
+    # How many records the memory handler will buffer before forcing a write to disk.
+    c_LogBufferRecordCount = 512
+
+    # How often the background flush thread will push buffered records to disk.
+    # This keeps INFO/DEBUG lines from sitting in memory too long, while still batching the file writes.
+    c_LogFlushIntervalSec = 2.0
+
     # Sets up and returns the main logger object
     @staticmethod
     def GetLogger(config:Config, logDir:str, logLevelOverride_CanBeNone:str) -> logging.Logger:
@@ -42,10 +103,38 @@ class LoggerInit:
         # Setup the file logger
         maxFileSizeBytes = config.GetIntIfInRange(Config.LoggingSection, Config.LogFileMaxSizeMbKey, 3, 1, 5000) * 1024 * 1024
         maxFileCount = config.GetIntIfInRange(Config.LoggingSection, Config.LogFileMaxCountKey, 1, 1, 50)
-        file = logging.handlers.RotatingFileHandler(
+        file = BufferedRotatingFileHandler(
             os.path.join(logDir, "octoeverywhere.log"),
             maxBytes=maxFileSizeBytes, backupCount=maxFileCount)
         file.setFormatter(formatter)
-        logger.addHandler(file)
+
+        # Logging is a hot path under busy websocket and mdns traffic, and the file handler does a write and flush
+        # per record, which is a syscall per log line. Instead of attaching the file handler directly, wrap it in a
+        # memory handler that batches records and only hits the disk when the buffer fills, an ERROR or higher record
+        # arrives, or the background flush thread fires. flushOnClose makes sure logging.shutdown() still flushes on exit.
+        memHandler = logging.handlers.MemoryHandler(capacity=LoggerInit.c_LogBufferRecordCount, flushLevel=logging.ERROR, target=file, flushOnClose=True)
+        logger.addHandler(memHandler)
+
+        # Start the background thread that periodically flushes the buffered records to disk.
+        LoggerInit._StartPeriodicFlushThread(memHandler, file)
 
         return logger
+
+
+    # Starts a background thread that flushes the buffered log records on an interval, so INFO and DEBUG
+    # lines always make it to disk within a few seconds even if the buffers never fill. Both layers need
+    # the push - the memory handler hands its records to the file handler, and the file handler's stream
+    # buffer gets flushed to disk.
+    @staticmethod
+    def _StartPeriodicFlushThread(memHandler:logging.handlers.MemoryHandler, fileHandler:BufferedRotatingFileHandler) -> None:
+        def flushWorker():
+            while True:
+                try:
+                    time.sleep(LoggerInit.c_LogFlushIntervalSec)
+                    memHandler.flush()
+                    fileHandler.FlushToDisk()
+                except Exception as e:
+                    print("Exception in logger flush thread. "+str(e))
+        flushThread = threading.Thread(target=flushWorker, name="LoggerPeriodicFlush")
+        flushThread.daemon = True
+        flushThread.start()
@@ -1,11 +1,15 @@
 import os
+import functools
 
 class Version:
 
     # Parses the common plugin version from the setup.py file.
     # Throws if the file can't be found or the version string can't be found.
     # This logic is shared with the moonraker installer!
+    # The result is cached, since the version is asked for a few times during startup and updates,
+    # and setup.py never changes while the process is running.
     @staticmethod
+    @functools.lru_cache(maxsize=4)
     def GetPluginVersion(repoRoot):
         # Since OctoPrint says the version must be in the setup.py file, we share the same file to reduce any duplication.
         setupFilePath = os.path.join(repoRoot, "setup.py")
@@ -1,40 +1,17 @@
-import logging
 import traceback
 
-from octoeverywhere.mdns import MDns
+# Note that we only import what __init__ and the smaller handlers need at the module level.
+# Everything that's only needed once RunBlocking is going drags in a large dependency graph, so
+# those imports are done inside RunBlocking. On slow disk targets this keeps the import phase of startup short.
 from octoeverywhere.sentry import Sentry
-from octoeverywhere.deviceid import DeviceId
-from octoeverywhere.telemetry import Telemetry
 from octoeverywhere.hostcommon import HostCommon
-from octoeverywhere.compression import Compression
-from octoeverywhere.octopingpong import OctoPingPong
-from octoeverywhere.httpsessions import HttpSessions
-from octoeverywhere.Webcam.webcamhelper import WebcamHelper
-from octoeverywhere.printinfo import PrintInfoManager
-from octoeverywhere.commandhandler import CommandHandler
-from octoeverywhere.octoeverywhereimpl import OctoEverywhere
-from octoeverywhere.octohttprequest import OctoHttpRequest
-from octoeverywhere.Proto.ServerHost import ServerHost
-from octoeverywhere.localip import LocalIpHelper
 from octoeverywhere.compat import Compat
 
 from linux_host.config import Config
-from linux_host.secrets import Secrets
-from linux_host.version import Version
 from linux_host.logger import LoggerInit
 
-from .smartpause import SmartPause
-from .uipopupinvoker import UiPopupInvoker
 from .systemconfigmanager import SystemConfigManager
 from .moonrakerclient import MoonrakerClient
-from .moonrakercommandhandler import MoonrakerCommandHandler
-from .moonrakerwebcamhelper import MoonrakerWebcamHelper
-from .moonrakerdatabase import MoonrakerDatabase
-from .webrequestresponsehandler import MoonrakerWebRequestResponseHandler
-from .moonrakerapirouter import MoonrakerApiRouter
-from .moonrakercredentailmanager import MoonrakerCredentialManager
-from .filemetadatacache import FileMetadataCache
-from .uiinjector import UiInjector
 
 # This file is the main host for the moonraker service.
 class MoonrakerHost:
@@ -74,12 +51,42 @@ class MoonrakerHost:
                     devConfig_CanBeNone):
         # Do all of this in a try catch, so we can log any issues before exiting
         try:
-            self.Logger.info("################################################")
-            if isCompanionMode:
-                self.Logger.info("## OctoEverywhere Klipper Companion Starting  ##")
-            else:
-                self.Logger.info("##### OctoEverywhere For Klipper Starting ######")
-            self.Logger.info("################################################")
+            # These are only needed to get the main runner going, so import them now instead of at module
+            # load, which keeps the process import phase as small as possible.
+            # pylint: disable=import-outside-toplevel
+            from octoeverywhere.mdns import MDns
+            from octoeverywhere.deviceid import DeviceId
+            from octoeverywhere.telemetry import Telemetry
+            from octoeverywhere.compression import Compression
+            from octoeverywhere.octopingpong import OctoPingPong
+            from octoeverywhere.httpsessions import HttpSessions
+            from octoeverywhere.Webcam.webcamhelper import WebcamHelper
+            from octoeverywhere.printinfo import PrintInfoManager
+            from octoeverywhere.commandhandler import CommandHandler
+            from octoeverywhere.octoeverywhereimpl import OctoEverywhere
+            from octoeverywhere.octohttprequest import OctoHttpRequest
+            from octoeverywhere.Proto.ServerHost import ServerHost
+            from octoeverywhere.localip import LocalIpHelper
+
+            from linux_host.secrets import Secrets
+            from linux_host.version import Version
+
+            from .smartpause import SmartPause
+            from .uipopupinvoker import UiPopupInvoker
+            from .moonrakercommandhandler import MoonrakerCommandHandler
+            from .moonrakerwebcamhelper import MoonrakerWebcamHelper
+            from .moonrakerdatabase import MoonrakerDatabase
+            from .webrequestresponsehandler import MoonrakerWebRequestResponseHandler
+            from .moonrakerapirouter import MoonrakerApiRouter
+            from .moonrakercredentailmanager import MoonrakerCredentialManager
+            from .filemetadatacache import FileMetadataCache
+            from .uiinjector import UiInjector
+
+            # Log the banner as one record, so it only costs a single handler invocation.
+            self.Logger.info("\n".join([
+                "################################################",
+                "## OctoEverywhere Klipper Companion Starting  ##" if isCompanionMode else "##### OctoEverywhere For Klipper Starting ######",
+                "################################################"]))
 
             # Set companion mode flag as soon as we know it.
             Compat.SetIsCompanionMode(isCompanionMode)
@@ -107,11 +114,8 @@ class MoonrakerHost:
             self.Secrets = Secrets(self.Logger, localStorageDir, self.Config)
 
             # Now, detect if this is a new instance and we need to init our global vars. If so, the setup script will be waiting on this.
-            self.DoFirstTimeSetupIfNeeded(klipperConfigDir, serviceName)
-
-            # Get our required vars
-            printerId = self.GetPrinterId()
-            privateKey = self.GetPrivateKey()
+            # This returns the printer id and private key it just validated or created, so we don't hit the secret store again.
+            (printerId, privateKey) = self.DoFirstTimeSetupIfNeeded(klipperConfigDir, serviceName)
 
             # Set the printer id to Sentry.
             Sentry.SetPrinterId(printerId)
@@ -210,17 +214,20 @@ class MoonrakerHost:
         except Exception as e:
             Sentry.Exception("!! Exception thrown out of main host run function.", e)
 
-        # Allow the loggers to flush before we exit
+        # Log the exit banner. Note there's no need to call logging.shutdown() here, the logging module
+        # registers it as an atexit handler and the buffered memory handler flushes on close, so the
+        # final lines still make it to disk.
         try:
-            self.Logger.info("##################################")
-            self.Logger.info("#### OctoEverywhere Exiting ######")
-            self.Logger.info("##################################")
-            logging.shutdown()
+            self.Logger.info("\n".join([
+                "##################################",
+                "#### OctoEverywhere Exiting ######",
+                "##################################"]))
         except Exception as e:
-            print("Exception in logging.shutdown "+str(e))
+            print("Exception when writing the exit log message "+str(e))
 
 
     # Ensures all required values are setup and valid before starting.
+    # Returns the validated (printerId, privateKey) tuple, so callers don't have to read them from the secret store again.
     def DoFirstTimeSetupIfNeeded(self, klipperConfigDir, serviceName):
         # Try to get the printer id from the config.
         isFirstRun = False
@@ -258,6 +265,8 @@ class MoonrakerHost:
         if isFirstRun:
             SystemConfigManager.EnsureAllowedServicesFile(self.Logger, klipperConfigDir, serviceName)
 
+        return (printerId, privateKey)
+
 
     # Returns None if no printer id has been set.
     def GetPrinterId(self):
@@ -271,13 +280,14 @@ class MoonrakerHost:
 
     # Tries to load a dev config option as a string.
     # If not found or it fails, this return None
-    def GetDevConfigStr(self, devConfig, value):
+    @staticmethod
+    def GetDevConfigStr(devConfig, value):
         if devConfig is None:
             return None
-        if value in devConfig:
-            v = devConfig[value]
-            if v is not None and len(v) > 0 and v != "None":
-                return v
+        # Use a single get, so we only do one dict lookup.
+        v = devConfig.get(value)
+        if v is not None and len(v) > 0 and v != "None":
+            return v
         return None
 
 
@@ -301,17 +311,18 @@ class MoonrakerHost:
         # Check if this printer is unlinked, if so add a message to the log to help the user setup the printer if desired.
         # This would be if the skipped the printer link or missed it in the setup script.
         if connectedAccounts is None or len(connectedAccounts) == 0:
-            self.Logger.warning("")
-            self.Logger.warning("")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("          This Plugin Isn't Connected To OctoEverywhere!          ")
-            self.Logger.warning(" Use the following link to finish the setup and get remote access:")
-            self.Logger.warning(" %s", HostCommon.GetAddPrinterUrl(self.GetPrinterId(), False))
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            self.Logger.warning("")
-            self.Logger.warning("")
+            self.Logger.warning("\n".join([
+                "",
+                "",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "          This Plugin Isn't Connected To OctoEverywhere!          ",
+                " Use the following link to finish the setup and get remote access:",
+                " " + HostCommon.GetAddPrinterUrl(self.GetPrinterId(), False),
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~",
+                "",
+                ""]))
 
         # Now that we are connected, start the moonraker client.
         # We do this after the connection incase it needs to send any notifications or messages when starting.
@@ -1,5 +1,4 @@
 import os
-import stat
 
 from linux_host.version import Version
 
@@ -35,14 +34,18 @@ class Updater:
 
         # Enumerate all service file to find any local plugins, Sonic Pad plugins, companion service files, and bambu service files, since all service files contain this name.
         # Note GetServiceFileFolderPath will return dynamically based on the OsType detected.
-        # Use sorted, so the results are in a nice user presentable order.
+        # Use scandir so we don't build a list of every service on the system, filter as we walk it,
+        # and only sort the handful of matches at the end instead of the whole directory.
         foundOeServices = []
-        fileAndDirList = sorted(os.listdir(Paths.GetServiceFileFolderPath(context)))
-        for fileOrDirName in fileAndDirList:
-            Logger.Debug(f"Searching for OE services to update, found: {fileOrDirName}")
-            fileOrDirNameLower = fileOrDirName.lower()
-            if Configure.c_ServiceCommonName in fileOrDirNameLower:
-                foundOeServices.append(fileOrDirName)
+        serviceCommonName = Configure.c_ServiceCommonName
+        with os.scandir(Paths.GetServiceFileFolderPath(context)) as fileAndDirList:
+            for entry in fileAndDirList:
+                fileOrDirName = entry.name
+                Logger.Debug(f"Searching for OE services to update, found: {fileOrDirName}")
+                if serviceCommonName in fileOrDirName.lower():
+                    foundOeServices.append(fileOrDirName)
+        # Sort so the results are in a nice user presentable order.
+        foundOeServices.sort()
 
         if len(foundOeServices) == 0:
             Logger.Warn("No local, companion, or Bambu Connect plugins were found on this device.")
@@ -57,21 +60,24 @@ class Updater:
             Logger.Info(f"  {s}")
 
         Logger.Info("Restarting services...")
-        for s in foundOeServices:
-            if context.OsType == OsTypes.SonicPad:
-                # We need to build the fill name path
-                serviceFilePath = os.path.join(Paths.CrealityOsServiceFilePath, s)
-                Logger.Debug(f"Full service path: {serviceFilePath}")
-                Service.RestartSonicPadService(serviceFilePath, False)
-            elif context.OsType == OsTypes.K1:
-                # We need to build the fill name path
-                serviceFilePath = os.path.join(Paths.CrealityOsServiceFilePath, s)
-                Logger.Debug(f"Full service path: {serviceFilePath}")
-                Service.RestartK1Service(serviceFilePath, False)
-            elif context.OsType == OsTypes.Debian:
-                Service.RestartDebianService(s, False)
-            else:
-                raise Exception("This OS type doesn't support updating at this time.")
+        if context.OsType == OsTypes.Debian:
+            # Restart all of the services with one systemctl call, so systemd handles them in parallel.
+            # Each restart can block for seconds, so doing them one by one serializes all of that wait time.
+            Service.RestartDebianServices(foundOeServices, False)
+        else:
+            for s in foundOeServices:
+                if context.OsType == OsTypes.SonicPad:
+                    # We need to build the fill name path
+                    serviceFilePath = os.path.join(Paths.CrealityOsServiceFilePath, s)
+                    Logger.Debug(f"Full service path: {serviceFilePath}")
+                    Service.RestartSonicPadService(serviceFilePath, False)
+                elif context.OsType == OsTypes.K1:
+                    # We need to build the fill name path
+                    serviceFilePath = os.path.join(Paths.CrealityOsServiceFilePath, s)
+                    Logger.Debug(f"Full service path: {serviceFilePath}")
+                    Service.RestartK1Service(serviceFilePath, False)
+                else:
+                    raise Exception("This OS type doesn't support updating at this time.")
 
         pluginVersionStr = "Unknown"
         try:
@@ -127,13 +133,16 @@ cd $startingDir
                 targetPath="/root"
 
             # Create the file.
+            # The script is tiny and written exactly once, so open it unbuffered in binary mode and
+            # push the whole string out in a single write, rather than paying for a text-mode buffer
+            # that would just be flushed on close anyway.
             updateFilePath = os.path.join(targetPath, "update-octoeverywhere.sh")
-            with open(updateFilePath, 'w', encoding="utf-8") as f:
-                f.write(s)
-
-            # Make sure to make it executable
-            st = os.stat(updateFilePath)
-            os.chmod(updateFilePath, st.st_mode | stat.S_IEXEC)
+            with open(updateFilePath, 'wb', buffering=0) as f:
+                f.write(s.encode("utf-8"))
+                # Make sure to make it executable. Using fchmod on the handle we already have open
+                # avoids the stat and pathname re-lookup syscalls a stat + chmod pair would do.
+                # pylint: disable=no-member # Linux only
+                os.fchmod(f.fileno(), 0o755)
 
             # Ensure the user who launched the installer script has permissions to run it.
             Util.SetFileOwnerRecursive(updateFilePath, context.UserName)